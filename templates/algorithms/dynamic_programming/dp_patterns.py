@@ -1,11 +1,27 @@
 # Dynamic Programming Templates - Python
 # Common DP patterns for competitive programming
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; pure-Python paths are used instead
+    np = None
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; falls back to NumPy/pure Python
+    njit = None
+
+INT64_MAX = (1 << 63) - 1
+FLOAT64_INT_LIMIT = 1 << 53  # Integers up to this are exact in float64
+
 
 def knapsack_01(weights, values, capacity):
     """
     0/1 Knapsack Problem
-    Time: O(n * capacity), Space: O(n * capacity)
+    Time: O(n * capacity), Space: O(capacity)
+
+    Single rolling row: with NumPy each item is one vectorized pass,
+    otherwise capacities are walked downward so each item is used once.
 
     Args:
         weights: List of item weights
@@ -16,27 +32,84 @@ def knapsack_01(weights, values, capacity):
         Maximum value achievable
     """
     n = len(weights)
-    dp = [[0] * (capacity + 1) for _ in range(n + 1)]
-
-    for i in range(1, n + 1):
-        for w in range(capacity + 1):
-            # Don't take item i-1
-            dp[i][w] = dp[i-1][w]
-
-            # Take item i-1 if it fits
-            if weights[i-1] <= w:
-                dp[i][w] = max(dp[i][w],
-                              dp[i-1][w - weights[i-1]] + values[i-1])
 
-    return dp[n][capacity]
+    vals = _exact_array(values) if np is not None and n else None
+    if vals is not None and vals.dtype.kind == 'i':
+        # Sums beyond int64 range stay on the list loop
+        if sum(abs(int(v)) for v in values) > INT64_MAX:
+            vals = None
+    if vals is not None and vals.dtype.kind in 'if':
+        dp = np.zeros(capacity + 1, dtype=vals.dtype)
+        for i in range(n):
+            wi = weights[i]
+            if wi <= capacity:
+                # The sum is materialized before the write, so every read
+                # sees the previous item's row even though slices overlap
+                np.maximum(dp[wi:], dp[:capacity + 1 - wi] + vals[i],
+                           out=dp[wi:])
+        return dp[capacity].item()
+
+    dp = [0] * (capacity + 1)
+
+    for i in range(n):
+        wi, vi = weights[i], values[i]
+        for w in range(capacity, wi - 1, -1):
+            # Take item i if it beats leaving it
+            if dp[w - wi] + vi > dp[w]:
+                dp[w] = dp[w - wi] + vi
+
+    return dp[capacity]
+
+
+def _exact_array(seq):
+    """
+    1-D numeric NumPy array of seq, or None if np.asarray() would not hold
+    every element exactly (ints past int64, or ints past 2**53 coerced to
+    float64 alongside floats).
+    """
+    arr = np.asarray(seq)
+    if arr.ndim != 1 or arr.dtype.kind not in 'iuf':
+        return None
+    if arr.dtype.kind == 'f' and not isinstance(seq, np.ndarray):
+        if any(abs(x) > FLOAT64_INT_LIMIT for x in seq
+               if not isinstance(x, (float, np.floating))):
+            return None
+    return arr
 
 
 def longest_common_subsequence(s1, s2):
     """
     Longest Common Subsequence (LCS)
     Time: O(m * n), Space: O(m * n)
+
+    With NumPy and str inputs, cells on an anti-diagonal i + j = d only
+    depend on diagonals d-1 and d-2, so each diagonal is one vectorized
+    step over three rotating buffers (O(m) space).
     """
     m, n = len(s1), len(s2)
+
+    if m == 0 or n == 0:
+        return 0
+
+    a = b = None
+    if np is not None:
+        a, b = _code_points(s1), _code_points(s2)
+
+    if a is not None and b is not None:
+        # Buffers are indexed by i; entries 0 and d (j == 0) stay zero
+        prev2 = np.zeros(m + 1, dtype=np.int32)
+        prev1 = np.zeros(m + 1, dtype=np.int32)
+        cur = np.zeros(m + 1, dtype=np.int32)
+
+        for d in range(2, m + n + 1):
+            lo, hi = max(1, d - n), min(m, d - 1)
+            eq = a[lo-1:hi] == b[d-hi-1:d-lo][::-1]
+            cur[lo:hi+1] = np.where(eq, prev2[lo-1:hi] + 1,
+                                    np.maximum(prev1[lo-1:hi], prev1[lo:hi+1]))
+            prev2, prev1, cur = prev1, cur, prev2
+
+        return int(prev1[m])
+
     dp = [[0] * (n + 1) for _ in range(m + 1)]
 
     for i in range(1, m + 1):
@@ -59,6 +132,11 @@ def longest_increasing_subsequence(arr):
     if not arr:
         return 0
 
+    if njit is not None:
+        values = _exact_array(arr)
+        if values is not None:
+            return int(_lis_kernel(values))
+
     tails = []
 
     for num in arr:
@@ -71,47 +149,133 @@ def longest_increasing_subsequence(arr):
     return len(tails)
 
 
+if njit is not None:
+    @njit(cache=True)
+    def _lis_kernel(arr):
+        """Compiled patience LIS with a branch-free lower bound on tails."""
+        tails = np.empty(arr.size, dtype=arr.dtype)
+        length = 0
+
+        for num in arr:
+            pos = 0
+            if length > 0:
+                base, n = 0, length
+                while n > 1:
+                    half = n >> 1
+                    base += half * (tails[base + half] < num)
+                    n -= half
+                pos = base + (tails[base] < num)
+
+            tails[pos] = num
+            if pos == length:
+                length += 1
+
+        return length
+
+
 def coin_change(coins, amount):
     """
     Minimum coins needed to make amount
     Time: O(amount * n), Space: O(amount)
     """
-    dp = [float('inf')] * (amount + 1)
+    if njit is not None:
+        # Coins above amount can never be used (and may not fit int64)
+        coin_arr = np.asarray([c for c in coins if c <= amount],
+                              dtype=np.int64)
+        return int(_coin_change_kernel(coin_arr, amount))
+
+    sentinel = amount + 1  # More coins than any feasible answer
+    dp = [sentinel] * (amount + 1)
     dp[0] = 0
 
     for coin in coins:
         for x in range(coin, amount + 1):
-            dp[x] = min(dp[x], dp[x - coin] + 1)
+            if dp[x - coin] + 1 < dp[x]:
+                dp[x] = dp[x - coin] + 1
+
+    return dp[amount] if dp[amount] != sentinel else -1
+
 
-    return dp[amount] if dp[amount] != float('inf') else -1
+if njit is not None:
+    @njit(cache=True)
+    def _coin_change_kernel(coins, amount):
+        """Compiled unbounded-knapsack DP; amount + 1 marks unreachable."""
+        sentinel = amount + 1
+        dp = np.full(amount + 1, sentinel, dtype=np.int64)
+        dp[0] = 0
+
+        for coin in coins:
+            for x in range(coin, amount + 1):
+                v = dp[x - coin] + 1
+                if v < dp[x]:
+                    dp[x] = v
+
+        return -1 if dp[amount] == sentinel else dp[amount]
 
 
 def edit_distance(word1, word2):
     """
     Minimum edit distance (Levenshtein distance)
-    Time: O(m * n), Space: O(m * n)
+    Time: O(m * n), Space: O(n)
+
+    Keeps only the previous and current rows. With NumPy and str inputs
+    each row is a handful of vectorized ops: the insert dependency
+    cur[j-1] + 1 is a running minimum, cur[j] = j + min(t[k] - k, k <= j).
     """
     m, n = len(word1), len(word2)
-    dp = [[0] * (n + 1) for _ in range(m + 1)]
 
-    # Initialize base cases
-    for i in range(m + 1):
-        dp[i][0] = i
-    for j in range(n + 1):
-        dp[0][j] = j
+    w1 = w2 = None
+    if np is not None:
+        w1, w2 = _code_points(word1), _code_points(word2)
+
+    if w1 is not None and w2 is not None:
+        steps = np.arange(n + 1, dtype=np.int32)
+        prev = steps.copy()
+
+        for i in range(1, m + 1):
+            cost = (w2 != w1[i-1]).astype(np.int32)
+            cur = np.empty_like(prev)
+            cur[0] = i
+            # Delete vs. replace/match
+            np.minimum(prev[1:] + 1, prev[:-1] + cost, out=cur[1:])
+            # Insert
+            cur -= steps
+            np.minimum.accumulate(cur, out=cur)
+            cur += steps
+            prev = cur
+
+        return int(prev[n])
+
+    prev = list(range(n + 1))
 
     for i in range(1, m + 1):
+        cur = [i] + [0] * n
         for j in range(1, n + 1):
             if word1[i-1] == word2[j-1]:
-                dp[i][j] = dp[i-1][j-1]
+                cur[j] = prev[j-1]
             else:
-                dp[i][j] = 1 + min(
-                    dp[i-1][j],      # delete
-                    dp[i][j-1],      # insert
-                    dp[i-1][j-1]     # replace
+                cur[j] = 1 + min(
+                    prev[j],      # delete
+                    cur[j-1],     # insert
+                    prev[j-1]     # replace
                 )
+        prev = cur
 
-    return dp[m][n]
+    return prev[n]
+
+
+def _code_points(s):
+    """
+    String as a uint32 array of code points, or None for non-str input or
+    text UTF-32 cannot encode (lone surrogates).
+    """
+    if not isinstance(s, str):
+        return None
+    try:
+        data = s.encode('utf-32-le')
+    except UnicodeEncodeError:
+        return None
+    return np.frombuffer(data, dtype=np.uint32)
 
 
 def matrix_chain_multiplication(dimensions):
@@ -126,21 +290,53 @@ def matrix_chain_multiplication(dimensions):
         Minimum number of scalar multiplications
     """
     n = len(dimensions) - 1
+
+    # Every scalar-multiplication count is bounded by n * max(d)^3
+    if njit is not None and n > 0 and max(dimensions) ** 3 * n <= INT64_MAX:
+        d = np.asarray(dimensions, dtype=np.int64)
+        return int(_matrix_chain_kernel(d))
+
     dp = [[0] * n for _ in range(n)]
 
     for length in range(2, n + 1):
         for i in range(n - length + 1):
             j = i + length - 1
-            dp[i][j] = float('inf')
+            # Seed with the k = i split; Python ints need no sentinel
+            best = (dp[i+1][j] +
+                    dimensions[i] * dimensions[i+1] * dimensions[j+1])
 
-            for k in range(i, j):
+            for k in range(i + 1, j):
                 cost = (dp[i][k] + dp[k+1][j] +
                        dimensions[i] * dimensions[k+1] * dimensions[j+1])
-                dp[i][j] = min(dp[i][j], cost)
+                if cost < best:
+                    best = cost
+
+            dp[i][j] = best
 
     return dp[0][n-1] if n > 0 else 0
 
 
+if njit is not None:
+    @njit(cache=True)
+    def _matrix_chain_kernel(d):
+        """Compiled bottom-up MCM over a flat n*n table (dp[i*n + j])."""
+        n = d.size - 1
+        dp = np.zeros(n * n, dtype=np.int64)
+
+        for length in range(2, n + 1):
+            for i in range(n - length + 1):
+                j = i + length - 1
+                best = INT64_MAX
+                for k in range(i, j):
+                    cost = (dp[i*n + k] + dp[(k+1)*n + j] +
+                            d[i] * d[k+1] * d[j+1])
+                    if cost < best:
+                        best = cost
+                dp[i*n + j] = best
+
+        return dp[n - 1]
+
+
 # Example usage
 if __name__ == "__main__":
     # Knapsack
@@ -1,8 +1,91 @@
 # Graph Algorithms Template - Python
 # Common graph algorithms for competitive programming
 
-from collections import deque, defaultdict
+from array import array
+from collections import deque
 import heapq
+import math
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; pure-Python paths are used instead
+    np = None
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; falls back to NumPy/pure Python
+    njit = None
+
+try:
+    from numba import cuda, float64
+except ImportError:  # CUDA support is optional; BFS/APSP stay on the CPU
+    cuda = None
+
+# Integer "no path" sentinel for int64 distance arrays: S + S cannot
+# overflow, and anything at or above S // 2 is reported as float('inf')
+DIST_INF = ((1 << 63) - 1) // 4
+
+FW_BLOCK = 64  # Strip height for blocked Floyd-Warshall
+FW_BLOCKED_MIN_VERTICES = 512  # Measured crossover vs. one broadcast per k
+FLOAT32_INT_LIMIT = 1 << 24  # Integer weights up to this are exact in float32
+GPU_BFS_MIN_VERTICES = 1 << 15  # Smaller graphs stay on the CPU queue
+GPU_FW_MIN_VERTICES = 512  # Smaller matrices stay on the CPU
+GPU_FW_BLOCK = 32  # Tile edge for CUDA Floyd-Warshall (one thread per cell)
+GPU_THREADS_PER_BLOCK = 256
+
+
+def _bucket_order(keys, order, buckets):
+    """Stable counting sort of the index sequence order by keys[i]."""
+    starts = [0] * (buckets + 1)
+    for i in order:
+        starts[keys[i] + 1] += 1
+    for b in range(buckets):
+        starts[b + 1] += starts[b]
+
+    out = array('i', bytes(4 * len(keys)))
+    for i in order:
+        k = keys[i]
+        out[starts[k]] = i
+        starts[k] += 1
+    return out
+
+
+def _pack_csr_numpy(V, indptr, indices, weights, coo_src, coo_dst,
+                    coo_weight):
+    """
+    Merge packed CSR edges with pending COO edges into new CSR buffers,
+    using one stable argsort on (source, neighbor).
+    """
+    wdtype = np.float32 if weights.typecode == 'f' else np.float64
+    counts = np.diff(np.frombuffer(indptr, dtype=np.int32))
+
+    # Already-packed edges first, so ties keep insertion order
+    src = np.concatenate([
+        np.repeat(np.arange(V, dtype=np.int64), counts),
+        np.frombuffer(coo_src, dtype=np.int32)])
+    dst = np.concatenate([np.frombuffer(indices, dtype=np.int32),
+                          np.frombuffer(coo_dst, dtype=np.int32)])
+    wt = np.concatenate([np.frombuffer(weights, dtype=wdtype),
+                         np.frombuffer(coo_weight, dtype=np.float64)])
+
+    order = np.argsort(src * V + dst, kind='stable')
+    new_indptr = np.zeros(V + 1, dtype=np.int32)
+    np.cumsum(np.bincount(src, minlength=V), out=new_indptr[1:])
+
+    exact_f32 = bool(np.all((wt == np.trunc(wt)) &
+                            (np.abs(wt) <= FLOAT32_INT_LIMIT)))
+    wt = wt[order].astype(np.float32 if exact_f32 else np.float64)
+
+    return (_as_array('i', new_indptr),
+            _as_array('i', dst[order]),
+            _as_array('f' if exact_f32 else 'd', wt))
+
+
+def _as_array(typecode, values):
+    """Copy a NumPy array into an array.array of the matching typecode."""
+    out = array(typecode)
+    out.frombytes(values.tobytes())
+    return out
 
 
 class Graph:
@@ -10,60 +93,189 @@ class Graph:
 
     def __init__(self, vertices):
         self.V = vertices
-        self.graph = defaultdict(list)
+        # Edges added since the last finalize(), as typed COO columns
+        self.coo_src = array('i')
+        self.coo_dst = array('i')
+        self.coo_weight = array('d')
+        # CSR adjacency packed by finalize()
+        self.indptr = array('i', bytes(4 * (vertices + 1)))
+        self.indices = array('i')
+        self.weights = array('f')
 
     def add_edge(self, u, v, weight=1):
         """Add edge from u to v with optional weight."""
-        self.graph[u].append((v, weight))
+        self.coo_src.append(u)
+        self.coo_dst.append(v)
+        self.coo_weight.append(weight)
+
+    def finalize(self):
+        """
+        Pack pending edges into CSR (struct-of-arrays) form.
+        Time: O(V + E), Space: O(V + E)
+
+        indptr (int32[V+1]), indices (int32[E]) and weights (float32[E] if
+        every weight is an integer float32 holds exactly, else float64) are
+        flat typed buffers: neighbors of u are the contiguous slice
+        indptr[u]:indptr[u+1], and np.frombuffer() views them without a
+        copy. Neighbors within each row are sorted by id, which keeps the
+        visited-check branch predictable and visited[] accesses local in
+        BFS/DFS. Traversals call this automatically when edges are pending.
+        """
+        V = self.V
+        # Compiled traversals index without bounds checks; reject bad ids
+        if self.coo_src:
+            if np is not None:
+                src = np.frombuffer(self.coo_src, dtype=np.int32)
+                dst = np.frombuffer(self.coo_dst, dtype=np.int32)
+                lo = int(min(src.min(), dst.min()))
+                hi = int(max(src.max(), dst.max()))
+            else:
+                lo = min(min(self.coo_src), min(self.coo_dst))
+                hi = max(max(self.coo_src), max(self.coo_dst))
+            if lo < 0 or hi >= V:
+                raise IndexError(
+                    f"edge endpoint {lo if lo < 0 else hi} out of range "
+                    f"for graph with {V} vertices")
+
+        if np is not None:
+            self.indptr, self.indices, self.weights = _pack_csr_numpy(
+                V, self.indptr, self.indices, self.weights,
+                self.coo_src, self.coo_dst, self.coo_weight)
+        else:
+            self._pack_csr_python()
+
+        self.coo_src = array('i')
+        self.coo_dst = array('i')
+        self.coo_weight = array('d')
+
+    def _pack_csr_python(self):
+        """finalize() without NumPy: per-element stable bucket sorts."""
+        V = self.V
+        old_indptr = self.indptr
+
+        # Already-packed edges first, so ties keep insertion order
+        src = array('i')
+        for u in range(V):
+            src.extend(array('i', [u]) * (old_indptr[u + 1] - old_indptr[u]))
+        src += self.coo_src
+        dst = self.indices + self.coo_dst
+        wt = array('d', self.weights) + self.coo_weight
+
+        # Two stable bucket passes: by neighbor, then by source
+        order = _bucket_order(dst, range(len(dst)), V)
+        order = _bucket_order(src, order, V)
+
+        indptr = array('i', bytes(4 * (V + 1)))
+        for u in src:
+            indptr[u + 1] += 1
+        for u in range(V):
+            indptr[u + 1] += indptr[u]
+
+        exact_f32 = all(w.is_integer() and abs(w) <= FLOAT32_INT_LIMIT
+                        for w in wt)
+        self.indptr = indptr
+        self.indices = array('i', [dst[i] for i in order])
+        self.weights = array('f' if exact_f32 else 'd', [wt[i] for i in order])
+
+    def _csr(self):
+        """Return (indptr, indices, weights), finalizing pending edges."""
+        if self.coo_src:
+            self.finalize()
+        return self.indptr, self.indices, self.weights
 
     def bfs(self, start):
         """
         Breadth-First Search
         Time: O(V + E), Space: O(V)
+
+        Only indptr/indices are read; the weights buffer is never touched.
+        Large graphs run level-synchronously on a CUDA device when one is
+        available; vertices within a level are then ordered by id.
         """
-        visited = [False] * self.V
+        if not 0 <= start < self.V:
+            raise IndexError(f"start vertex {start} out of range")
+        indptr, indices, _ = self._csr()
+
+        if (cuda is not None and self.V >= GPU_BFS_MIN_VERTICES
+                and cuda.is_available()):
+            return _bfs_gpu(indptr, indices, start, self.V)
+
+        if njit is not None:
+            order = _bfs_kernel(np.frombuffer(indptr, dtype=np.int32),
+                                np.frombuffer(indices, dtype=np.int32),
+                                start, self.V)
+            return order.tolist()
+
+        visited = bytearray(self.V)
         queue = deque([start])
-        visited[start] = True
-        result = []
+        visited[start] = 1
+        result = array('i', bytes(4 * self.V))
+        ri = 0
 
         while queue:
             vertex = queue.popleft()
-            result.append(vertex)
+            result[ri] = vertex
+            ri += 1
 
-            for neighbor, _ in self.graph[vertex]:
+            for idx in range(indptr[vertex], indptr[vertex + 1]):
+                neighbor = indices[idx]
                 if not visited[neighbor]:
-                    visited[neighbor] = True
+                    visited[neighbor] = 1
                     queue.append(neighbor)
 
-        return result
+        return result[:ri].tolist()
 
     def dfs(self, start):
         """
         Depth-First Search (iterative)
         Time: O(V + E), Space: O(V)
         """
-        visited = [False] * self.V
+        indptr, indices, _ = self._csr()
+        visited = bytearray(self.V)
         stack = [start]
-        result = []
+        result = array('i', bytes(4 * self.V))
+        ri = 0
 
         while stack:
             vertex = stack.pop()
 
             if not visited[vertex]:
-                visited[vertex] = True
-                result.append(vertex)
+                visited[vertex] = 1
+                result[ri] = vertex
+                ri += 1
 
-                for neighbor, _ in self.graph[vertex]:
+                for idx in range(indptr[vertex], indptr[vertex + 1]):
+                    neighbor = indices[idx]
                     if not visited[neighbor]:
                         stack.append(neighbor)
 
-        return result
+        return result[:ri].tolist()
 
     def dijkstra(self, start):
         """
         Dijkstra's shortest path algorithm
         Time: O((V + E) log V), Space: O(V)
         """
+        if not 0 <= start < self.V:
+            raise IndexError(f"start vertex {start} out of range")
+        indptr, indices, weights = self._csr()
+
+        if njit is not None:
+            wdtype = np.float32 if weights.typecode == 'f' else np.float64
+            w = np.frombuffer(weights, dtype=wdtype)
+            # Integral weights relax as int64, like bellman_ford
+            int_w, _ = _int_distances(w, self.V)
+            if int_w is not None:
+                w = int_w
+                dist = np.full(self.V, DIST_INF, dtype=np.int64)
+            else:
+                dist = np.full(self.V, np.inf)
+
+            _dijkstra_kernel(np.frombuffer(indptr, dtype=np.int32),
+                             np.frombuffer(indices, dtype=np.int32),
+                             w, start, dist)
+            return _from_int_distances(dist)
+
         dist = [float('inf')] * self.V
         dist[start] = 0
         pq = [(0, start)]  # (distance, vertex)
@@ -74,33 +286,198 @@ class Graph:
             if d > dist[u]:
                 continue
 
-            for v, weight in self.graph[u]:
-                if dist[u] + weight < dist[v]:
-                    dist[v] = dist[u] + weight
+            for idx in range(indptr[u], indptr[u + 1]):
+                v = indices[idx]
+                if d + weights[idx] < dist[v]:
+                    dist[v] = d + weights[idx]
                     heapq.heappush(pq, (dist[v], v))
 
+        if weights.typecode == 'f':  # Integral weights: report ints
+            inf = float('inf')
+            dist = [int(d) if d != inf else d for d in dist]
+
         return dist
 
     def topological_sort(self):
         """
         Topological sort using DFS (for DAG)
         Time: O(V + E), Space: O(V)
+
+        Iterative: each stack entry is (vertex, next CSR edge index), so
+        deep graphs need no recursion limit.
         """
+        indptr, indices, _ = self._csr()
         visited = [False] * self.V
-        stack = []
-
-        def dfs_util(v):
-            visited[v] = True
-            for neighbor, _ in self.graph[v]:
-                if not visited[neighbor]:
-                    dfs_util(neighbor)
-            stack.append(v)
+        order = []
 
         for i in range(self.V):
-            if not visited[i]:
-                dfs_util(i)
+            if visited[i]:
+                continue
 
-        return stack[::-1]
+            visited[i] = True
+            stack = [(i, indptr[i])]
+
+            while stack:
+                v, idx = stack[-1]
+                end = indptr[v + 1]
+                while idx < end and visited[indices[idx]]:
+                    idx += 1
+
+                if idx < end:
+                    neighbor = indices[idx]
+                    stack[-1] = (v, idx + 1)
+                    visited[neighbor] = True
+                    stack.append((neighbor, indptr[neighbor]))
+                else:
+                    stack.pop()
+                    order.append(v)
+
+        return order[::-1]
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _bfs_kernel(indptr, indices, start, vertices):
+        """Compiled BFS over the CSR index stream; returns visit order."""
+        visited = np.zeros(vertices, dtype=np.uint8)
+        # Each vertex is enqueued once, so the queue doubles as the result
+        queue = np.empty(vertices, dtype=np.int32)
+        queue[0] = start
+        visited[start] = 1
+        head, tail = 0, 1
+
+        while head < tail:
+            u = queue[head]
+            head += 1
+            for idx in range(indptr[u], indptr[u + 1]):
+                v = indices[idx]
+                if not visited[v]:
+                    visited[v] = 1
+                    queue[tail] = v
+                    tail += 1
+
+        return queue[:tail]
+
+    @njit(cache=True)
+    def _heap_push(heap_dist, heap_node, size, d, node):
+        """Sift (d, node) up from the end of the heap; returns new size."""
+        i = size
+        while i > 0:
+            parent = (i - 1) >> 1
+            if heap_dist[parent] <= d:
+                break
+            heap_dist[i] = heap_dist[parent]
+            heap_node[i] = heap_node[parent]
+            i = parent
+        heap_dist[i] = d
+        heap_node[i] = node
+        return size + 1
+
+    @njit(cache=True)
+    def _heap_pop(heap_dist, heap_node, size):
+        """Remove the root, sifting the last entry down; returns new size."""
+        size -= 1
+        d = heap_dist[size]
+        node = heap_node[size]
+        i = 0
+        while True:
+            child = 2 * i + 1
+            if child >= size:
+                break
+            if child + 1 < size and heap_dist[child + 1] < heap_dist[child]:
+                child += 1
+            if heap_dist[child] >= d:
+                break
+            heap_dist[i] = heap_dist[child]
+            heap_node[i] = heap_node[child]
+            i = child
+        heap_dist[i] = d
+        heap_node[i] = node
+        return size
+
+    @njit(cache=True)
+    def _dijkstra_kernel(indptr, indices, weights, start, dist):
+        """
+        Compiled Dijkstra over CSR with a (dist, node) array heap; fills
+        dist (pre-set to its "unreached" value) in place.
+        """
+        dist[start] = 0
+
+        # Lazy deletion pushes at most once per edge relaxation
+        heap_dist = np.empty(indices.shape[0] + 1, dtype=dist.dtype)
+        heap_node = np.empty(indices.shape[0] + 1, dtype=np.int32)
+        size = _heap_push(heap_dist, heap_node, 0, dist[start], start)
+
+        while size > 0:
+            d = heap_dist[0]
+            u = heap_node[0]
+            size = _heap_pop(heap_dist, heap_node, size)
+
+            if d > dist[u]:
+                continue
+
+            for idx in range(indptr[u], indptr[u + 1]):
+                v = indices[idx]
+                nd = d + weights[idx]
+                if nd < dist[v]:
+                    dist[v] = nd
+                    size = _heap_push(heap_dist, heap_node, size, nd, v)
+
+        return dist
+
+
+if cuda is not None:
+    @cuda.jit
+    def _expand_frontier(indptr, indices, in_frontier, in_count,
+                         out_frontier, out_count, visited, level, levels):
+        """One thread per frontier vertex; claims neighbors via CAS."""
+        t = cuda.grid(1)
+        if t < in_count:
+            u = in_frontier[t]
+            for idx in range(indptr[u], indptr[u + 1]):
+                v = indices[idx]
+                if cuda.atomic.cas(visited, v, 0, 1) == 0:
+                    levels[v] = level + 1
+                    out_frontier[cuda.atomic.add(out_count, 0, 1)] = v
+
+
+def _bfs_gpu(indptr, indices, start, vertices):
+    """
+    Frontier-based BFS on the GPU over CSR buffers.
+    Time: O(levels) kernel launches, Space: O(V + E) device memory
+
+    Returns reachable vertices ordered by (level, vertex id).
+    """
+    visited = np.zeros(vertices, dtype=np.int32)
+    visited[start] = 1
+    levels = np.full(vertices, -1, dtype=np.int32)
+    levels[start] = 0
+    frontier = np.zeros(vertices, dtype=np.int32)
+    frontier[0] = start
+
+    d_indptr = cuda.to_device(np.frombuffer(indptr, dtype=np.int32))
+    d_indices = cuda.to_device(np.frombuffer(indices, dtype=np.int32))
+    d_visited = cuda.to_device(visited)
+    d_levels = cuda.to_device(levels)
+    d_in = cuda.to_device(frontier)
+    d_out = cuda.device_array(vertices, dtype=np.int32)
+    zero = np.zeros(1, dtype=np.int32)
+    d_count = cuda.to_device(zero)
+
+    count, level = 1, 0
+    while count:
+        d_count.copy_to_device(zero)
+        blocks = (count + GPU_THREADS_PER_BLOCK - 1) // GPU_THREADS_PER_BLOCK
+        _expand_frontier[blocks, GPU_THREADS_PER_BLOCK](
+            d_indptr, d_indices, d_in, count, d_out, d_count,
+            d_visited, level, d_levels)
+        count = int(d_count.copy_to_host()[0])
+        d_in, d_out = d_out, d_in
+        level += 1
+
+    levels = d_levels.copy_to_host()
+    reached = np.flatnonzero(levels >= 0)
+    return reached[np.argsort(levels[reached], kind='stable')].tolist()
 
 
 def bellman_ford(vertices, edges, start):
@@ -116,6 +493,32 @@ def bellman_ford(vertices, edges, start):
     Returns:
         distances array or None if negative cycle exists
     """
+    if njit is not None:
+        arr = np.asarray(edges, dtype=np.float64).reshape(-1, 3)
+        # In-place rounds chain at most E edges each, V - 1 times
+        w, span = _int_distances(arr[:, 2], vertices * max(len(edges), 1))
+        # The kernel indexes dist unchecked; other ids go through the
+        # Python loop, which raises IndexError as before
+        ids = arr[:, :2]
+        in_range = not ids.size or (ids.min() >= 0 and ids.max() < vertices)
+
+        # Integral weights too large for int64 use the Python-int loop
+        if in_range and (span is None or w is not None):
+            u = arr[:, 0].astype(np.int32)
+            v = arr[:, 1].astype(np.int32)
+            if w is None:  # Fractional weights stay float64 with inf
+                w = arr[:, 2].copy()
+                dist = np.full(vertices, math.inf)
+                unreached = math.inf
+            else:
+                dist = np.full(vertices, DIST_INF, dtype=np.int64)
+                unreached = DIST_INF
+
+            dist[start] = 0
+            if _bellman_ford_relax(u, v, w, dist, vertices, unreached):
+                return None  # Negative cycle detected
+            return _from_int_distances(dist)
+
     dist = [float('inf')] * vertices
     dist[start] = 0
 
@@ -133,11 +536,39 @@ def bellman_ford(vertices, edges, start):
     return dist
 
 
+if njit is not None:
+    @njit(cache=True)
+    def _bellman_ford_relax(u, v, w, dist, vertices, unreached):
+        """Compiled V-1 relaxation rounds; returns True on a negative cycle."""
+        E = u.shape[0]
+        for _ in range(vertices - 1):
+            for i in range(E):
+                du = dist[u[i]]
+                if du != unreached:
+                    nd = du + w[i]
+                    if nd < dist[v[i]]:
+                        dist[v[i]] = nd
+
+        for i in range(E):
+            du = dist[u[i]]
+            if du != unreached and du + w[i] < dist[v[i]]:
+                return True
+        return False
+
+
 def floyd_warshall(adj_matrix):
     """
     Floyd-Warshall all-pairs shortest path
     Time: O(V^3), Space: O(V^2)
 
+    With NumPy available, each k-step relaxes the whole matrix in one
+    broadcast instead of V^2 interpreted min() calls; matrices of
+    FW_BLOCKED_MIN_VERTICES or more use the blocked variant. Integral
+    weights are relaxed as int64 with DIST_INF in place of float('inf')
+    when V * max|w| fits; larger integers use the Python-int loop. Matrices
+    of GPU_FW_MIN_VERTICES or more run the blocked algorithm on a CUDA
+    device when one is available.
+
     Args:
         adj_matrix: 2D adjacency matrix (use float('inf') for no edge)
 
@@ -145,16 +576,246 @@ def floyd_warshall(adj_matrix):
         2D matrix of shortest distances
     """
     V = len(adj_matrix)
+
+    if np is not None:
+        dist = np.array(adj_matrix, dtype=np.float64)  # Copy
+        int_dist, span = _int_distances(dist, V)
+
+    # Integral weights too large for int64 use the Python-int loop below
+    if np is not None and (span is None or int_dist is not None):
+        # float64 sums on the device are exact only below 2**53
+        if (cuda is not None and V >= GPU_FW_MIN_VERTICES
+                and (span is None or span < 2 ** 53)
+                and cuda.is_available()):
+            dist = _floyd_warshall_gpu(dist)
+            if int_dist is not None:
+                dist = np.where(np.isfinite(dist), dist,
+                                DIST_INF).astype(np.int64)
+            return _from_int_distances(dist)
+
+        if int_dist is not None:
+            dist = int_dist
+
+        if V >= FW_BLOCKED_MIN_VERTICES:
+            _floyd_warshall_blocked(dist, FW_BLOCK)
+        else:
+            for k in range(V):
+                np.minimum(dist, dist[:, k:k+1] + dist[k:k+1, :], out=dist)
+        return _from_int_distances(dist)
+
     dist = [row[:] for row in adj_matrix]  # Deep copy
+    inf = float('inf')
 
+    # Rows hoisted into locals; rows that cannot reach k are skipped
     for k in range(V):
+        dk = dist[k]
         for i in range(V):
+            di = dist[i]
+            dik = di[k]
+            if dik == inf:
+                continue
             for j in range(V):
-                dist[i][j] = min(dist[i][j], dist[i][k] + dist[k][j])
+                nv = dik + dk[j]
+                if nv < di[j]:
+                    di[j] = nv
 
     return dist
 
 
+def _int_distances(values, hops):
+    """
+    Pick integer arithmetic for a float64 copy of the caller's weights,
+    where a distance sums at most hops of them.
+
+    Returns (int_dist, span). span bounds |distance| (hops * max|w|), or
+    is None when any finite weight is fractional. int_dist is an int64
+    copy with inf mapped to DIST_INF, built only when float64 held every
+    integer exactly (< 2**53) and span < DIST_INF // 2, so no real
+    distance reads back as inf; otherwise it is None.
+    """
+    finite = np.isfinite(values)
+    weights = values[finite]
+    if not np.array_equal(weights, np.trunc(weights)):
+        return None, None
+
+    max_abs = int(np.abs(weights).max()) if weights.size else 0
+    span = max_abs * hops
+    if max_abs >= 2 ** 53 or span >= DIST_INF // 2:
+        return None, span
+    return np.where(finite, values, DIST_INF).astype(np.int64), span
+
+
+def _from_int_distances(dist):
+    """Distance array as (nested) lists, with DIST_INF mapped back to inf."""
+    if dist.dtype != np.int64:
+        return dist.tolist()
+    out = dist.astype(object)
+    out[dist >= DIST_INF // 2] = math.inf
+    return out.tolist()
+
+
+def _floyd_warshall_blocked(dist, block):
+    """
+    Blocked Floyd-Warshall on a NumPy matrix, in place.
+
+    For each pivot block: (1) close the pivot tile, (2) relax the pivot
+    row and column panels against it, (3) relax every other B x V row
+    strip with the min-plus product of its column tile and the pivot row
+    panel. A strip is reused for the block's B k-steps while it is still
+    in the outer cache levels, rather than the whole matrix being swept
+    once per k. Per-call NumPy overhead outweighs that below
+    FW_BLOCKED_MIN_VERTICES; above it the gain is modest (about 1.2x at
+    V = 1024). Splitting strips into B x B tiles measured slower.
+    """
+    V = dist.shape[0]
+
+    for kb in range(0, V, block):
+        ke = min(kb + block, V)
+        pivot = dist[kb:ke, kb:ke]
+        row = dist[kb:ke, :]
+        col = dist[:, kb:ke]
+
+        # Phase 1: pivot tile
+        for k in range(ke - kb):
+            np.minimum(pivot, pivot[:, k:k+1] + pivot[k:k+1, :], out=pivot)
+
+        # Phase 2: pivot row and column panels
+        for k in range(ke - kb):
+            np.minimum(row, pivot[:, k:k+1] + row[k:k+1, :], out=row)
+            np.minimum(col, col[:, k:k+1] + pivot[k:k+1, :], out=col)
+
+        # Phase 3: remaining row strips
+        for ib in range(0, V, block):
+            if ib == kb:
+                continue
+            ie = min(ib + block, V)
+            strip = dist[ib:ie, :]
+            for k in range(ke - kb):
+                np.minimum(strip, col[ib:ie, k:k+1] + row[k:k+1, :], out=strip)
+
+
+if cuda is not None:
+    @cuda.jit
+    def _fw_phase1(D, kb, V):
+        """Close the pivot tile (kb, kb) in shared memory."""
+        B = GPU_FW_BLOCK
+        tx, ty = cuda.threadIdx.x, cuda.threadIdx.y
+        i, j = kb * B + ty, kb * B + tx
+
+        tile = cuda.shared.array((GPU_FW_BLOCK, GPU_FW_BLOCK), float64)
+        tile[ty, tx] = D[i, j] if i < V and j < V else math.inf
+        cuda.syncthreads()
+
+        for k in range(B):
+            nv = tile[ty, k] + tile[k, tx]
+            cuda.syncthreads()
+            if nv < tile[ty, tx]:
+                tile[ty, tx] = nv
+            cuda.syncthreads()
+
+        if i < V and j < V:
+            D[i, j] = tile[ty, tx]
+
+    @cuda.jit
+    def _fw_phase2_row(D, kb, V):
+        """Relax pivot-row tile (kb, blockIdx.x) against the pivot tile."""
+        B = GPU_FW_BLOCK
+        jb = cuda.blockIdx.x
+        if jb == kb:
+            return
+        tx, ty = cuda.threadIdx.x, cuda.threadIdx.y
+        i, j = kb * B + ty, jb * B + tx
+        pj = kb * B + tx
+
+        pivot = cuda.shared.array((GPU_FW_BLOCK, GPU_FW_BLOCK), float64)
+        tile = cuda.shared.array((GPU_FW_BLOCK, GPU_FW_BLOCK), float64)
+        pivot[ty, tx] = D[i, pj] if i < V and pj < V else math.inf
+        tile[ty, tx] = D[i, j] if i < V and j < V else math.inf
+        cuda.syncthreads()
+
+        for k in range(B):
+            nv = pivot[ty, k] + tile[k, tx]
+            cuda.syncthreads()
+            if nv < tile[ty, tx]:
+                tile[ty, tx] = nv
+            cuda.syncthreads()
+
+        if i < V and j < V:
+            D[i, j] = tile[ty, tx]
+
+    @cuda.jit
+    def _fw_phase2_col(D, kb, V):
+        """Relax pivot-column tile (blockIdx.x, kb) against the pivot tile."""
+        B = GPU_FW_BLOCK
+        ib = cuda.blockIdx.x
+        if ib == kb:
+            return
+        tx, ty = cuda.threadIdx.x, cuda.threadIdx.y
+        i, j = ib * B + ty, kb * B + tx
+        pi = kb * B + ty
+
+        pivot = cuda.shared.array((GPU_FW_BLOCK, GPU_FW_BLOCK), float64)
+        tile = cuda.shared.array((GPU_FW_BLOCK, GPU_FW_BLOCK), float64)
+        pivot[ty, tx] = D[pi, j] if pi < V and j < V else math.inf
+        tile[ty, tx] = D[i, j] if i < V and j < V else math.inf
+        cuda.syncthreads()
+
+        for k in range(B):
+            nv = tile[ty, k] + pivot[k, tx]
+            cuda.syncthreads()
+            if nv < tile[ty, tx]:
+                tile[ty, tx] = nv
+            cuda.syncthreads()
+
+        if i < V and j < V:
+            D[i, j] = tile[ty, tx]
+
+    @cuda.jit
+    def _fw_phase3(D, kb, V):
+        """Min-plus update of tile (blockIdx.y, blockIdx.x) off the pivot."""
+        B = GPU_FW_BLOCK
+        ib, jb = cuda.blockIdx.y, cuda.blockIdx.x
+        if ib == kb or jb == kb:
+            return
+        tx, ty = cuda.threadIdx.x, cuda.threadIdx.y
+        i, j = ib * B + ty, jb * B + tx
+        ci, rj = kb * B + tx, kb * B + ty
+
+        col = cuda.shared.array((GPU_FW_BLOCK, GPU_FW_BLOCK), float64)
+        row = cuda.shared.array((GPU_FW_BLOCK, GPU_FW_BLOCK), float64)
+        col[ty, tx] = D[i, ci] if i < V and ci < V else math.inf
+        row[ty, tx] = D[rj, j] if rj < V and j < V else math.inf
+        cuda.syncthreads()
+
+        if i < V and j < V:
+            best = D[i, j]
+            for k in range(B):
+                nv = col[ty, k] + row[k, tx]
+                if nv < best:
+                    best = nv
+            D[i, j] = best
+
+
+def _floyd_warshall_gpu(dist):
+    """
+    Blocked Floyd-Warshall on the GPU; returns a new float64 matrix.
+    Time: O(V / B) rounds of four kernel launches, Space: O(V^2) device
+    """
+    V = dist.shape[0]
+    B = GPU_FW_BLOCK
+    nb = (V + B - 1) // B
+    threads = (B, B)
+
+    d_dist = cuda.to_device(dist)
+    for kb in range(nb):
+        _fw_phase1[1, threads](d_dist, kb, V)
+        _fw_phase2_row[nb, threads](d_dist, kb, V)
+        _fw_phase2_col[nb, threads](d_dist, kb, V)
+        _fw_phase3[(nb, nb), threads](d_dist, kb, V)
+
+    return d_dist.copy_to_host()
+
+
 # Example usage
 if __name__ == "__main__":
     g = Graph(6)
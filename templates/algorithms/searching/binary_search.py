@@ -2,6 +2,15 @@
 # Time Complexity: O(log n)
 # Space Complexity: O(1)
 
+from bisect import bisect_left, bisect_right
+
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:  # Numba is optional; the bisect C module is used
+    njit = None
+
+
 def binary_search(arr, target):
     """
     Standard binary search implementation.
@@ -13,33 +22,20 @@ def binary_search(arr, target):
     Returns:
         Index of target if found, -1 otherwise
     """
-    left, right = 0, len(arr) - 1
-
-    while left <= right:
-        mid = left + (right - left) // 2  # Avoid overflow
-
-        if arr[mid] == target:
-            return mid
-        elif arr[mid] < target:
-            left = mid + 1
-        else:
-            right = mid - 1
-
-    return -1
+    return binary_search_leftmost(arr, target)
 
 
 def binary_search_leftmost(arr, target):
     """
     Find leftmost occurrence of target.
-    """
-    left, right = 0, len(arr)
 
-    while left < right:
-        mid = left + (right - left) // 2
-        if arr[mid] < target:
-            left = mid + 1
-        else:
-            right = mid
+    Python sequences use bisect's C loop. NumPy arrays are dispatched to a
+    compiled branch-free lower bound when Numba is available.
+    """
+    if njit is not None and isinstance(arr, np.ndarray):
+        left = int(_lower_bound_jit(arr, target))
+    else:
+        left = bisect_left(arr, target)
 
     return left if left < len(arr) and arr[left] == target else -1
 
@@ -47,19 +43,55 @@ def binary_search_leftmost(arr, target):
 def binary_search_rightmost(arr, target):
     """
     Find rightmost occurrence of target.
-    """
-    left, right = 0, len(arr)
 
-    while left < right:
-        mid = left + (right - left) // 2
-        if arr[mid] <= target:
-            left = mid + 1
-        else:
-            right = mid
+    Same dispatch as binary_search_leftmost, on the upper bound.
+    """
+    if njit is not None and isinstance(arr, np.ndarray):
+        left = int(_upper_bound_jit(arr, target))
+    else:
+        left = bisect_right(arr, target)
 
     return left - 1 if left > 0 and arr[left - 1] == target else -1
 
 
+if njit is not None:
+    # Compiled with LLVM, which lowers the select to cmov
+    @njit(cache=True)
+    def _lower_bound_jit(arr, target):
+        """
+        First index i with arr[i] >= target (len(arr) if none).
+
+        Branch-free: a fixed ceil(log2 n) halvings with no early exit, so
+        the trip count is predictable.
+        """
+        n = len(arr)
+        if n == 0:
+            return 0
+
+        base = 0
+        while n > 1:
+            half = n >> 1
+            base += half * (arr[base + half] < target)
+            n -= half
+
+        return base + (arr[base] < target)
+
+    @njit(cache=True)
+    def _upper_bound_jit(arr, target):
+        """First index i with arr[i] > target (len(arr) if none)."""
+        n = len(arr)
+        if n == 0:
+            return 0
+
+        base = 0
+        while n > 1:
+            half = n >> 1
+            base += half * (arr[base + half] <= target)
+            n -= half
+
+        return base + (arr[base] <= target)
+
+
 # Example usage
 if __name__ == "__main__":
     arr = [1, 2, 3, 4, 5, 6, 7, 8, 9]